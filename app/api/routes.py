@@ -2,27 +2,48 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import functools
+import io
 import logging
-import tempfile
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
-import base64
-import os
-import io
-
+from typing import Any, Callable, Dict
 
+import ifcopenshell
 from fastapi import APIRouter, HTTPException
 
+try:  # SIMD base64 encoder; the stdlib codec is the fallback
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 from app.core.ifc_context import create_ifc_context
 from app.core.storage import get_storage_backend
-from app.models.base import GenerateRequest
+from app.models.base import GenerateRequest, PresignRequest, ProjectMetadata
 from app.plugins.registry import plugin_registry
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# ── Blocking work executor ────────────────────────────────────────
+# IFC builds and cloud uploads are synchronous; they run here so the
+# event loop stays free to accept and serve other requests.
+_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="bim-worker",
+)
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run *func* on the bounded worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args))
+
 
 @router.get("/health")
 async def health_check() -> Dict[str, str]:
@@ -34,17 +55,88 @@ async def health_check() -> Dict[str, str]:
 
 
 @router.post("/generate")
-async def generate_bim(request: GenerateRequest) -> Dict[str, Any]:
+async def generate_bim(
+    request: GenerateRequest, include_base64: bool = False
+) -> Dict[str, Any]:
     """Accept a list of element payloads and return an IFC file.
 
     Each element is routed to its registered plugin builder based on
-    the ``type`` discriminator field.
+    the ``type`` discriminator field.  The build and the upload run on
+    a worker thread so concurrent requests are not serialised.
+
+    The file is always returned by URL; pass ``?include_base64=true``
+    to also receive it inline.
+    """
+    result = await _run_blocking(_build_ifc, request)
+    file_bytes: bytes = result["file_bytes"]
+    file_name: str = result["file_name"]
+
+    storage = get_storage_backend()
+    download_url = await _run_blocking(
+        storage.upload, file_name, io.BytesIO(file_bytes), len(file_bytes)
+    )
+
+    inline = None
+    if include_base64:
+        inline = {
+            "data": await _run_blocking(_b64encode, file_bytes),
+            "filename": file_name,
+            "size": len(file_bytes),
+            "mime_type": "application/octet-stream"  # Adjust based on your file type
+        }
+
+    return {
+        "status": "success",
+        "file_url": download_url,
+        "base64": inline,
+        "created_elements": result["created_elements"],
+        "warnings": result["warnings"],
+    }
+
+
+@router.post("/presign")
+async def presign_upload(request: PresignRequest) -> Dict[str, Any]:
+    """Return a signed URL the client can ``PUT`` a file to directly.
+
+    Large uploads then go straight to the bucket and never occupy a
+    service worker.  The ``PUT`` must carry every header in
+    ``required_headers`` and a body of exactly ``size`` bytes.  Only
+    available with a cloud storage backend.
+    """
+    blob_name = f"upload_{uuid.uuid4().hex[:12]}_{Path(request.fileName).name}"
+    storage = get_storage_backend()
+    try:
+        upload_url, required_headers = await _run_blocking(
+            storage.create_signed_put_url,
+            blob_name,
+            request.contentType,
+            request.size,
+        )
+    except NotImplementedError as exc:
+        raise HTTPException(status_code=501, detail=str(exc)) from exc
+
+    return {
+        "status": "success",
+        "upload_url": upload_url,
+        "required_headers": required_headers,
+        "file_name": blob_name,
+    }
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode *data* for inline JSON transport."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _build_ifc(request: GenerateRequest) -> Dict[str, Any]:
+    """Synchronously build the IFC model described by *request*.
+
+    Raises ``HTTPException(422)`` when no element could be built.
     """
     # ── Resolve project metadata ─────────────────────────────
-    meta = request.metadata or type(request.metadata)()  # defaults
-    if request.metadata is None:
-        from app.models.base import ProjectMetadata
-        meta = ProjectMetadata()
+    meta = request.metadata or ProjectMetadata()
 
     model, storey, body_context = create_ifc_context(
         project_name=meta.projectName,
@@ -57,10 +149,29 @@ async def generate_bim(request: GenerateRequest) -> Dict[str, Any]:
     created_elements: list[str] = []
     errors: list[str] = []
 
+    # Resolve each distinct type once.  Builders are constructed on first
+    # lookup, so a failing constructor is reported per element like an
+    # unknown type instead of failing the whole request.
+    builders: Dict[str, Any] = {}
+    unresolved: Dict[str, Exception] = {}
+    for element_type in {element.type for element in request.elements}:
+        try:
+            builders[element_type] = plugin_registry.get(element_type)
+        except KeyError as exc:
+            unresolved[element_type] = exc
+        except Exception as exc:
+            logger.exception("Could not construct the %s builder", element_type)
+            unresolved[element_type] = exc
+
     for idx, element in enumerate(request.elements):
         element_type = element.type
+        if element_type in unresolved:
+            exc = unresolved[element_type]
+            errors.append(f"Element #{idx}: {exc}")
+            logger.error("No usable plugin for element #%d: %s", idx, exc)
+            continue
+        builder = builders[element_type]
         try:
-            builder = plugin_registry.get(element_type)
             product = builder.build(model, body_context, storey, element)
             created_elements.append(
                 f"{element_type}:{getattr(product, 'Name', f'element_{idx}')}"
@@ -69,9 +180,6 @@ async def generate_bim(request: GenerateRequest) -> Dict[str, Any]:
         except NotImplementedError as exc:
             errors.append(f"Element #{idx} ({element_type}): {exc}")
             logger.warning("Skipped element #%d: %s", idx, exc)
-        except KeyError as exc:
-            errors.append(f"Element #{idx}: {exc}")
-            logger.error("Unknown plugin for element #%d: %s", idx, exc)
         except Exception as exc:
             errors.append(f"Element #{idx} ({element_type}): {exc}")
             logger.exception("Error building element #%d", idx)
@@ -85,41 +193,24 @@ async def generate_bim(request: GenerateRequest) -> Dict[str, Any]:
             },
         )
 
-    # ── Write IFC to tmp & upload ────────────────────────────
-    tmp_dir = Path(tempfile.gettempdir())
-    filename = f"bim_{uuid.uuid4().hex[:12]}.ifc"
-    local_path = str(tmp_dir / filename)
-    # TODO : commenting this part as it not saving anywher
-    #model.write(local_path)
-    logger.info("Wrote IFC file: %s", local_path)
-
-    ifc_string = model.to_string()
-    file_content = ifc_string.encode("utf-8")
-    base64_encoded = base64.b64encode(file_content).decode("utf-8")
-    file_size = len(file_content)
+    # ── Serialise IFC ────────────────────────────────────────
+    file_bytes = _ifc_bytes(model)
     file_name = f"bim_{uuid.uuid4().hex[:12]}.ifc"
-    
-    storage = get_storage_backend()
-    download_url = storage.upload(local_path)
-
-    # Read the file and convert to base64
-    #with open(local_path, "rb") as file:
-        #file_content = file.read()
-        #base64_encoded = base64.b64encode(file_content).decode('utf-8')
-    
-    # Get file info
-    #file_name = os.path.basename(local_path)
-    #file_size = os.path.getsize(local_path)
+    logger.info("Serialised IFC file %s (%d bytes)", file_name, len(file_bytes))
 
     return {
-        "status": "success",
-        "file_url": download_url, 
-        "base64": {
-            "data": base64_encoded,
-            "filename": file_name,
-            "size": file_size,
-            "mime_type": "application/octet-stream"  # Adjust based on your file type
-        },
+        "file_bytes": file_bytes,
+        "file_name": file_name,
         "created_elements": created_elements,
         "warnings": errors if errors else None,
     }
+
+
+def _ifc_bytes(model: ifcopenshell.file) -> bytes:
+    """Serialise *model* to UTF-8 STEP bytes.
+
+    The intermediate ``str`` only lives for the duration of the encode;
+    the returned buffer is the single copy shared (without further
+    copies) by the upload stream and the optional base64 encoder.
+    """
+    return model.to_string().encode("utf-8")
@@ -5,10 +5,15 @@ Creates the standard IFC spatial structure:
 
 Returns the ``(model, storey, body_context)`` tuple that every element
 builder needs to attach geometry.
+
+The hierarchy is built through the IfcOpenShell API only once per
+process; every request then parses a copy of that cached template and
+renames / re-identifies its entities.
 """
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Tuple
 
 import ifcopenshell
@@ -19,6 +24,8 @@ import ifcopenshell.api.unit
 import ifcopenshell.api.spatial
 import ifcopenshell.util.shape_builder
 
+from app.core.ifc_entities import bulk_guids
+
 if TYPE_CHECKING:
     pass
 
@@ -40,10 +47,35 @@ def create_ifc_context(
     body_context : IfcGeometricRepresentationSubContext
         The ``Body`` sub-context for 3-D shape representations.
     """
+    model = ifcopenshell.file.from_string(_template_spf())
+
+    # Every file must carry its own GlobalIds, not the template's.
+    roots = model.by_type("IfcRoot")
+    for entity, global_id in zip(roots, bulk_guids(len(roots))):
+        entity.GlobalId = global_id
+
+    model.by_type("IfcProject")[0].Name = project_name
+    model.by_type("IfcSite")[0].Name = site_name
+    model.by_type("IfcBuilding")[0].Name = building_name
+    storey = model.by_type("IfcBuildingStorey")[0]
+    storey.Name = storey_name
+
+    body_context = next(
+        ctx
+        for ctx in model.by_type("IfcGeometricRepresentationSubContext")
+        if ctx.ContextIdentifier == "Body"
+    )
+
+    return model, storey, body_context
+
+
+@functools.lru_cache(maxsize=None)
+def _template_spf() -> str:
+    """Build the default hierarchy once and cache it as STEP text."""
     model = ifcopenshell.file(schema="IFC4")
 
     # ── Project (must exist BEFORE unit assignment) ───────────
-    project = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcProject", name=project_name)
+    project = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcProject", name="OpenPlans BIM Project")
 
     # ── Units (SI metres — NOT the IfcOpenShell default of mm) ──
     length = ifcopenshell.api.run("unit.add_si_unit", model, unit_type="LENGTHUNIT", prefix=None)
@@ -63,13 +95,13 @@ def create_ifc_context(
     )
 
     # ── Spatial hierarchy ────────────────────────────────────
-    site = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcSite", name=site_name)
-    building = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcBuilding", name=building_name)
-    storey = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcBuildingStorey", name=storey_name)
+    site = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcSite", name="Default Site")
+    building = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcBuilding", name="Default Building")
+    storey = ifcopenshell.api.run("root.create_entity", model, ifc_class="IfcBuildingStorey", name="Ground Floor")
 
     # Aggregate: Project → Site → Building → Storey
     ifcopenshell.api.run("aggregate.assign_object", model, relating_object=project, products=[site])
     ifcopenshell.api.run("aggregate.assign_object", model, relating_object=site, products=[building])
     ifcopenshell.api.run("aggregate.assign_object", model, relating_object=building, products=[storey])
 
-    return model, storey, body_context
+    return model.to_string()
@@ -3,25 +3,54 @@
 Supports three backends selected via the ``STORAGE_BACKEND`` env var:
     - ``gcs``   → Google Cloud Storage (signed URL)
     - ``s3``    → AWS S3 (pre-signed URL)
-    - ``local`` → Fallback for development (returns local path)
+    - ``local`` → Fallback for development (writes to the tmp dir)
 """
 
 from __future__ import annotations
 
 import os
 import datetime
+import functools
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import BinaryIO, Dict, Tuple
+
+IFC_CONTENT_TYPE = "application/x-step"
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB; GCS requires a multiple of 256 KiB
+SIGNED_PUT_EXPIRATION = datetime.timedelta(minutes=15)
 
 
 class StorageBackend(ABC):
     """Interface every storage backend must implement."""
 
     @abstractmethod
-    def upload(self, local_path: str) -> str:
-        """Upload *local_path* and return a download URL / path."""
+    def upload(self, blob_name: str, stream: BinaryIO, size: int) -> str:
+        """Store *size* bytes read from *stream* under *blob_name*.
+
+        Implementations read the stream in chunks so memory use does not
+        grow with the file.  Returns a download URL / path.
+        """
         ...
 
+    def create_signed_put_url(
+        self, blob_name: str, content_type: str, size: int
+    ) -> Tuple[str, Dict[str, str]]:
+        """Return a short-lived URL the client can ``PUT`` *blob_name* to.
+
+        Lets clients upload large files straight to the bucket instead
+        of proxying the bytes through the service.  *size* is the exact
+        byte length of the upload; a body of any other length is
+        rejected by the bucket.
+
+        Returns ``(url, headers)``: the signature covers *headers*, so
+        the client must send every one of them with exactly that value.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support signed uploads."
+        )
+
 
 # ── Google Cloud Storage ──────────────────────────────────────────
 
@@ -35,10 +64,11 @@ class GCSBackend(StorageBackend):
         self._client = gcs.Client()
         self._bucket = self._client.bucket(self._bucket_name)
 
-    def upload(self, local_path: str) -> str:
-        blob_name = Path(local_path).name
-        blob = self._bucket.blob(blob_name)
-        blob.upload_from_filename(local_path)
+    def upload(self, blob_name: str, stream: BinaryIO, size: int) -> str:
+        blob = self._bucket.blob(blob_name, chunk_size=UPLOAD_CHUNK_SIZE)
+        blob.upload_from_file(
+            stream, size=size, content_type=IFC_CONTENT_TYPE, rewind=False
+        )
         url = blob.generate_signed_url(
             version="v4",
             expiration=datetime.timedelta(hours=1),
@@ -46,6 +76,22 @@ class GCSBackend(StorageBackend):
         )
         return url
 
+    def create_signed_put_url(
+        self, blob_name: str, content_type: str, size: int
+    ) -> Tuple[str, Dict[str, str]]:
+        # GCS cannot sign Content-Length itself; a min == max range
+        # header pins the upload to exactly *size* bytes instead.
+        signed_headers = {"x-goog-content-length-range": f"{size},{size}"}
+        blob = self._bucket.blob(blob_name)
+        url = blob.generate_signed_url(
+            version="v4",
+            expiration=SIGNED_PUT_EXPIRATION,
+            method="PUT",
+            content_type=content_type,
+            headers=signed_headers,
+        )
+        return url, {"Content-Type": content_type, **signed_headers}
+
 
 # ── AWS S3 ────────────────────────────────────────────────────────
 
@@ -54,37 +100,77 @@ class S3Backend(StorageBackend):
 
     def __init__(self) -> None:
         import boto3  # lazy import
+        from botocore.config import Config
 
         self._bucket_name = os.environ["S3_BUCKET"]
         self._region = os.environ.get("AWS_REGION", "us-east-1")
-        self._s3 = boto3.client("s3", region_name=self._region)
+        self._s3 = boto3.client(
+            "s3",
+            region_name=self._region,
+            config=Config(
+                max_pool_connections=64,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
 
-    def upload(self, local_path: str) -> str:
-        key = Path(local_path).name
-        self._s3.upload_file(local_path, self._bucket_name, key)
+    def upload(self, blob_name: str, stream: BinaryIO, size: int) -> str:
+        from boto3.s3.transfer import TransferConfig  # lazy import
+
+        self._s3.upload_fileobj(
+            stream,
+            self._bucket_name,
+            blob_name,
+            ExtraArgs={"ContentType": IFC_CONTENT_TYPE},
+            Config=TransferConfig(
+                multipart_chunksize=UPLOAD_CHUNK_SIZE, use_threads=True
+            ),
+        )
         url = self._s3.generate_presigned_url(
             "get_object",
-            Params={"Bucket": self._bucket_name, "Key": key},
+            Params={"Bucket": self._bucket_name, "Key": blob_name},
             ExpiresIn=3600,
         )
         return url
 
+    def create_signed_put_url(
+        self, blob_name: str, content_type: str, size: int
+    ) -> Tuple[str, Dict[str, str]]:
+        url = self._s3.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self._bucket_name,
+                "Key": blob_name,
+                "ContentType": content_type,
+                "ContentLength": size,
+            },
+            ExpiresIn=int(SIGNED_PUT_EXPIRATION.total_seconds()),
+        )
+        # Content-Length is signed too, but HTTP clients set it from the body
+        return url, {"Content-Type": content_type}
+
 
 # ── Local fallback (dev) ─────────────────────────────────────────
 
 class LocalBackend(StorageBackend):
-    """No upload — just return the local path.  For development only."""
+    """Write to the system tmp dir and return the path.  For development only."""
 
-    def upload(self, local_path: str) -> str:
-        return local_path
+    def upload(self, blob_name: str, stream: BinaryIO, size: int) -> str:
+        local_path = Path(tempfile.gettempdir()) / blob_name
+        with open(local_path, "wb") as fh:
+            shutil.copyfileobj(stream, fh, UPLOAD_CHUNK_SIZE)
+        return str(local_path)
 
 
 # ── Factory ───────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def get_storage_backend() -> StorageBackend:
     """Select a backend based on the ``STORAGE_BACKEND`` env var.
 
-    Defaults to ``local`` when the variable is unset.
+    Defaults to ``local`` when the variable is unset.  The instance is
+    cached for the life of the process so the cloud client and its
+    connection pool are reused across requests (both the GCS and boto3
+    clients are thread-safe).
     """
     backend = os.environ.get("STORAGE_BACKEND", "local").lower()
     if backend == "gcs":
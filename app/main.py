@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
 
+import ifcopenshell.api
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router
+from app.core.ifc_context import create_ifc_context
 from app.plugins.registry import discover_plugins
 
 # ── Logging ───────────────────────────────────────────────────────
@@ -19,7 +22,56 @@ logging.basicConfig(
 # ── Plugin auto-discovery (populates the registry) ───────────────
 discover_plugins()
 
+
+# ── IFC warm-up ──────────────────────────────────────────────────
+def _warm_ifc() -> None:
+    """Exercise every IfcOpenShell usecase the builders rely on.
+
+    ``ifcopenshell.api.run`` imports usecase modules lazily, so without
+    this the first request of each worker pays for those imports and for
+    building the project template.  The throwaway model is discarded.
+    """
+    model, _storey, body_context = create_ifc_context()
+    wall_rep = ifcopenshell.api.run(
+        "geometry.add_wall_representation",
+        model,
+        context=body_context,
+        length=1.0,
+        height=1.0,
+        thickness=0.1,
+    )
+    ifcopenshell.api.run(
+        "geometry.add_door_representation",
+        model,
+        context=body_context,
+        overall_height=2.0,
+        overall_width=1.0,
+    )
+    style = ifcopenshell.api.run("style.add_style", model, name="warm-up")
+    ifcopenshell.api.run(
+        "style.add_surface_style",
+        model,
+        style=style,
+        ifc_class="IfcSurfaceStyleShading",
+        attributes={
+            "SurfaceColour": {"Name": None, "Red": 1.0, "Green": 1.0, "Blue": 1.0},
+        },
+    )
+    ifcopenshell.api.run(
+        "style.assign_representation_styles",
+        model,
+        shape_representation=wall_rep,
+        styles=[style],
+    )
+    model.to_string()
+
+
+_warm_ifc()
+
 # ── FastAPI app ──────────────────────────────────────────────────
+# No custom response class: from FastAPI 0.130 (the floor in
+# requirements.txt) routes with a return annotation serialise straight
+# to JSON bytes in pydantic-core, which covers the base64 payload.
 app = FastAPI(
     title="OpenPlans BIM Service",
     description=(
@@ -30,11 +82,20 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# ── CORS (allow all origins for dev; tighten in production) ──────
+# ── CORS ─────────────────────────────────────────────────────────
+# CORS_ORIGINS is a comma-separated allow-list, parsed once here; unset
+# means any origin (dev).  Credentials are only allowed with an explicit
+# list: combined with a wildcard, Starlette must echo and re-validate
+# the Origin header on every response.
+_cors_origins = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_cors_origins,
+    allow_credentials="*" not in _cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -9,7 +9,14 @@ from __future__ import annotations
 
 from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Discriminator, Field, Tag
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    Tag,
+    field_validator,
+    model_validator,
+)
 
 
 # ── Geometry primitives ───────────────────────────────────────────
@@ -43,14 +50,23 @@ class WallPayload(BaseModel):
     point connects back to the first to close the polygon.  Each
     segment uses ``geometry.add_wall_representation`` (the official
     IfcOpenShell API) to create a proper thin-rectangle wall.
+
+    Vertices may be sent either as ``points`` (``{x, y, z}`` objects) or
+    as ``pointsFlat`` (``[x, y, z]`` triples, cheaper to validate for
+    long polygons).  After validation ``pointsFlat`` is always set and
+    is what the builder reads; ``points`` is cleared.
     """
 
     type: Literal["WALL"] = "WALL"
     name: str = Field(default="Wall", description="Human-readable wall name")
-    points: List[Point3D] = Field(
-        ..., min_length=2, description="Polygon vertices (Three.js coords). "
+    points: Optional[List[Point3D]] = Field(
+        default=None, description="Polygon vertices (Three.js coords). "
         "Consecutive pairs become wall segments; the polygon is auto-closed."
     )
+    pointsFlat: Optional[List[List[float]]] = Field(
+        default=None, description="Polygon vertices as [x, y, z] triples "
+        "(Three.js coords).  Alternative to 'points'; send one, not both."
+    )
     wallThickness: float = Field(
         ..., gt=0, description="Wall thickness in metres"
     )
@@ -63,6 +79,27 @@ class WallPayload(BaseModel):
         description="Hex colour, e.g. '#FF5733'",
     )
 
+    @field_validator("pointsFlat")
+    @classmethod
+    def _check_triples(cls, v: Optional[List[List[float]]]) -> Optional[List[List[float]]]:
+        if v is not None and any(len(pt) != 3 for pt in v):
+            raise ValueError("each pointsFlat entry must be an [x, y, z] triple")
+        return v
+
+    @model_validator(mode="after")
+    def _coerce_to_flat(self) -> "WallPayload":
+        if self.points is not None and self.pointsFlat is not None:
+            raise ValueError("send either 'points' or 'pointsFlat', not both")
+        if self.pointsFlat is None:
+            if self.points is None:
+                raise ValueError("either 'points' or 'pointsFlat' is required")
+            self.pointsFlat = [[pt.x, pt.y, pt.z] for pt in self.points]
+            # Keep only the flat form so a dumped wall validates again
+            self.points = None
+        if len(self.pointsFlat) < 2:
+            raise ValueError("a wall needs at least 2 points")
+        return self
+
 
 class WindowPayload(BaseModel):
     """Stub schema for future window plugin."""
@@ -127,3 +164,11 @@ class GenerateRequest(BaseModel):
         ..., min_length=1, description="One or more element payloads"
     )
     metadata: Optional[ProjectMetadata] = Field(default=None)
+
+
+class PresignRequest(BaseModel):
+    """Payload accepted by ``POST /presign``."""
+
+    fileName: str = Field(..., min_length=1, description="Name of the file to upload")
+    contentType: str = Field(default="application/octet-stream")
+    size: int = Field(..., gt=0, description="Exact file size in bytes")
@@ -0,0 +1,21 @@
+"""Element builder plugins.
+
+Submodules are imported on first attribute access (PEP 562), so
+``elements.door`` only loads the door builder.  ``discover_plugins``
+still imports every module explicitly to populate the registry.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+
+def __getattr__(name: str) -> ModuleType:
+    module_name = f"{__name__}.{name}"
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
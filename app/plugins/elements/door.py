@@ -7,18 +7,23 @@ in the IFC Z-up coordinate system.
 
 from __future__ import annotations
 
+import functools
 import math
 from typing import Any, Tuple
 
 import ifcopenshell
 import ifcopenshell.api
-import ifcopenshell.api.root
-import ifcopenshell.api.spatial
 import ifcopenshell.api.geometry
 import ifcopenshell.api.style
 
+from app.core.ifc_entities import (
+    assign_container,
+    assign_representation,
+    create_product,
+    get_owner_history,
+)
 from app.models.base import DoorPayload, Point3D
-from app.plugins.registry import ElementBuilder, plugin_registry
+from app.plugins.registry import ElementBuilder
 
 
 # ── Coordinate helpers ────────────────────────────────────────────
@@ -31,6 +36,7 @@ def _threejs_to_ifc(pt: Point3D) -> Tuple[float, float, float]:
     return (pt.x, -pt.z, pt.y)
 
 
+@functools.lru_cache(maxsize=256)
 def _int_to_rgb(color_int: int) -> Tuple[float, float, float]:
     """Convert an integer RGB color (e.g. 0xC7C7C7) to a normalized (0-1) tuple."""
     r = ((color_int >> 16) & 0xFF) / 255.0
@@ -41,8 +47,7 @@ def _int_to_rgb(color_int: int) -> Tuple[float, float, float]:
 
 # ── Door builder ──────────────────────────────────────────────────
 
-@plugin_registry.register("DOOR")
-class DoorBuilder(ElementBuilder):
+class DoorBuilder(ElementBuilder, type_key="DOOR"):
     """Builds an IfcDoor with shape representation and styles."""
 
     def build(
@@ -61,12 +66,8 @@ class DoorBuilder(ElementBuilder):
             door_name = f"{payload.labelName}_{payload.ogid}"
 
         # 2. Create IfcDoor entity
-        door = ifcopenshell.api.run(
-            "root.create_entity",
-            model,
-            ifc_class="IfcDoor",
-            name=door_name,
-        )
+        owner_history = get_owner_history(model)
+        door = create_product(model, "IfcDoor", door_name, owner_history)
 
         # 3. Add door representation
         # Lining properties (frame)
@@ -92,12 +93,7 @@ class DoorBuilder(ElementBuilder):
         )
 
         # 4. Assign representation
-        ifcopenshell.api.run(
-            "geometry.assign_representation",
-            model,
-            product=door,
-            representation=representation,
-        )
+        assign_representation(model, door, representation)
 
         # 5. Object Placement (oriented appropriately based on swingRotation if needed, but defaults to unit vectors)
         # Convert swingRotation (radians or degrees) to rotation around IFC Z-axis.
@@ -177,11 +173,6 @@ class DoorBuilder(ElementBuilder):
             )
 
         # 7. Assign to storey
-        ifcopenshell.api.run(
-            "spatial.assign_container",
-            model,
-            relating_structure=storey,
-            products=[door],
-        )
+        assign_container(model, storey, [door], owner_history)
 
         return door
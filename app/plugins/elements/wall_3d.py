@@ -9,40 +9,82 @@ Ref: https://docs.ifcopenshell.org/ifcopenshell-python/geometry_creation.html
 
 from __future__ import annotations
 
-import math
+import functools
 from typing import Any, List, Tuple
 
 import ifcopenshell
 import ifcopenshell.api
-import ifcopenshell.api.root
-import ifcopenshell.api.spatial
 import ifcopenshell.api.geometry
 import ifcopenshell.api.style
+import numpy as np
 
-from app.models.base import Point3D, WallPayload
-from app.plugins.registry import ElementBuilder, plugin_registry
+from app.core.ifc_entities import (
+    assign_container,
+    assign_representation,
+    bulk_guids,
+    create_product,
+    get_owner_history,
+)
+from app.models.base import WallPayload
+from app.plugins.registry import ElementBuilder
 
 
 # ── Coordinate helpers ────────────────────────────────────────────
 
-def _threejs_to_ifc(pt: Point3D) -> Tuple[float, float, float]:
-    """Convert a Three.js point (Y-up) to IFC (Z-up).
+_IFC_AXES = [0, 2, 1]
+_IFC_SIGNS = np.array([1.0, -1.0, 1.0])
+
+
+def _batch_to_ifc(points: List[List[float]]) -> np.ndarray:
+    """Convert ``[x, y, z]`` Three.js triples (Y-up) to an ``(N, 3)`` IFC (Z-up) array.
 
     Mapping:  Three.js (x, y, z) → IFC (x, -z, y)
     """
-    return (pt.x, -pt.z, pt.y)
+    xyz = np.asarray(points, dtype=np.float64)
+    return xyz[:, _IFC_AXES] * _IFC_SIGNS
 
 
+@functools.lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
     """Convert ``#RRGGBB`` to normalised (0-1) RGB tuple."""
     h = hex_color.lstrip("#")
     return tuple(int(h[i : i + 2], 16) / 255.0 for i in (0, 2, 4))  # type: ignore[return-value]
 
 
+def _wall_style(model: ifcopenshell.file, hex_color: str) -> Any:
+    """Return the model's shared surface style for *hex_color*.
+
+    Created on first use and reused by every wall segment of that
+    colour, instead of one style per segment.
+    """
+    name = f"WallStyle_{hex_color.upper()}"
+    for style in model.by_type("IfcSurfaceStyle"):
+        if style.Name == name:
+            return style
+
+    rgb = _hex_to_rgb(hex_color)
+    style = ifcopenshell.api.run("style.add_style", model, name=name)
+    ifcopenshell.api.run(
+        "style.add_surface_style",
+        model,
+        style=style,
+        ifc_class="IfcSurfaceStyleShading",
+        attributes={
+            "SurfaceColour": {
+                "Name": hex_color,
+                "Red": rgb[0],
+                "Green": rgb[1],
+                "Blue": rgb[2],
+            },
+            "Transparency": 0.0,
+        },
+    )
+    return style
+
+
 # ── Wall builder ──────────────────────────────────────────────────
 
-@plugin_registry.register("WALL")
-class Wall3DBuilder(ElementBuilder):
+class Wall3DBuilder(ElementBuilder, type_key="WALL"):
     """Build wall segments from a closed polygon of points.
 
     For N points, creates N wall segments (the last point connects
@@ -59,30 +101,40 @@ class Wall3DBuilder(ElementBuilder):
         payload: WallPayload,
     ) -> Any:
         # Transform all points: Three.js Y-up → IFC Z-up
-        ifc_pts = [_threejs_to_ifc(pt) for pt in payload.points]
-        n = len(ifc_pts)
-        rgb = _hex_to_rgb(payload.wallColor)
+        pts = _batch_to_ifc(payload.pointsFlat)
+
+        # Segment lengths and unit directions on the XY plane, computed in
+        # one pass (consecutive pairs only, no auto-close).  Degenerate
+        # zero-length segments point along +X, as atan2(0, 0) did.
+        deltas = np.diff(pts[:, :2], axis=0)
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        nonzero = lengths > 0
+        safe_lengths = np.where(nonzero, lengths, 1.0)
+        cos_a = np.where(nonzero, deltas[:, 0] / safe_lengths, 1.0)
+        sin_a = deltas[:, 1] / safe_lengths
+
+        name = payload.name
+        height = payload.wallHeight
+        thickness = payload.wallThickness
+        style = _wall_style(model, payload.wallColor)
+        owner_history = get_owner_history(model)
+        guids = bulk_guids(len(lengths))
+
+        # Placement directions are shared: one Z axis for every segment and
+        # one RefDirection per distinct heading (rectilinear plans repeat).
+        z_axis = model.createIfcDirection((0.0, 0.0, 1.0))
+        ref_directions: dict[tuple[float, float], Any] = {}
 
         walls: list[Any] = []
 
-        for i in range(n - 1):
-            p1 = ifc_pts[i]
-            p2 = ifc_pts[i + 1]  # consecutive pairs only, no auto-close
-
-            # Wall length and direction on the XY plane
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            wall_length = math.hypot(dx, dy)
-            angle = math.atan2(dy, dx)
-
-            seg_name = f"{payload.name}_{i + 1}"
+        for i, (p1, wall_length, cos, sin) in enumerate(
+            zip(pts[:-1].tolist(), lengths.tolist(), cos_a.tolist(), sin_a.tolist())
+        ):
+            seg_name = f"{name}_{i + 1}"
 
             # 1. Create wall entity
-            wall = ifcopenshell.api.run(
-                "root.create_entity",
-                model,
-                ifc_class="IfcWall",
-                name=seg_name,
+            wall = create_product(
+                model, "IfcWall", seg_name, owner_history, global_id=guids[i]
             )
 
             # 2. Official add_wall_representation → thin rectangle extruded
@@ -93,51 +145,32 @@ class Wall3DBuilder(ElementBuilder):
                 model,
                 context=body_context,
                 length=wall_length,
-                height=payload.wallHeight,
-                thickness=payload.wallThickness,
-                offset=-payload.wallThickness / 2,
+                height=height,
+                thickness=thickness,
+                offset=-thickness / 2,
             )
 
             # 3. Assign representation
-            ifcopenshell.api.run(
-                "geometry.assign_representation",
-                model,
-                product=wall,
-                representation=representation,
-            )
+            assign_representation(model, wall, representation)
 
             # 4. Object Placement: start at p1, oriented toward p2
+            heading = (round(cos, 6), round(sin, 6))
+            ref_direction = ref_directions.get(heading)
+            if ref_direction is None:
+                ref_direction = model.createIfcDirection((cos, sin, 0.0))
+                ref_directions[heading] = ref_direction
+
             wall.ObjectPlacement = model.createIfcLocalPlacement(
                 RelativePlacement=model.createIfcAxis2Placement3D(
                     Location=model.createIfcCartesianPoint(
                         (p1[0], p1[1], p1[2])
                     ),
-                    Axis=model.createIfcDirection((0.0, 0.0, 1.0)),
-                    RefDirection=model.createIfcDirection(
-                        (math.cos(angle), math.sin(angle), 0.0)
-                    ),
+                    Axis=z_axis,
+                    RefDirection=ref_direction,
                 )
             )
 
-            # 5. Surface colour
-            style = ifcopenshell.api.run(
-                "style.add_style", model, name=f"{seg_name}_style"
-            )
-            ifcopenshell.api.run(
-                "style.add_surface_style",
-                model,
-                style=style,
-                ifc_class="IfcSurfaceStyleShading",
-                attributes={
-                    "SurfaceColour": {
-                        "Name": payload.wallColor,
-                        "Red": rgb[0],
-                        "Green": rgb[1],
-                        "Blue": rgb[2],
-                    },
-                    "Transparency": 0.0,
-                },
-            )
+            # 5. Surface colour (shared style, one styled item per rep)
             ifcopenshell.api.run(
                 "style.assign_representation_styles",
                 model,
@@ -145,15 +178,10 @@ class Wall3DBuilder(ElementBuilder):
                 styles=[style],
             )
 
-            # 6. Assign to storey
-            ifcopenshell.api.run(
-                "spatial.assign_container",
-                model,
-                relating_structure=storey,
-                products=[wall],
-            )
-
             walls.append(wall)
 
+        # 6. Assign every segment to the storey in one relationship
+        assign_container(model, storey, walls, owner_history)
+
         # Return the first wall (for backward compat with single-return tests)
         return walls[0]
@@ -6,16 +6,16 @@ of that type, but the geometry builder is not yet implemented.
 
 from __future__ import annotations
 
-from typing import Any
-
-import ifcopenshell
+from typing import TYPE_CHECKING, Any
 
 from app.models.base import WindowPayload
-from app.plugins.registry import ElementBuilder, plugin_registry
+from app.plugins.registry import ElementBuilder
+
+if TYPE_CHECKING:
+    import ifcopenshell
 
 
-@plugin_registry.register("WINDOW")
-class WindowBuilder(ElementBuilder):
+class WindowBuilder(ElementBuilder, type_key="WINDOW"):
     """Placeholder — raises ``NotImplementedError`` with guidance."""
 
     def build(
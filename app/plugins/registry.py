@@ -2,27 +2,53 @@
 
 Usage
 -----
-1. Subclass ``ElementBuilder`` and implement ``build()``.
-2. Decorate the class with ``@plugin_registry.register("WALL")``
-   (or the appropriate type key).
-3. At import-time the class is registered; the core API resolves
-   builders via ``plugin_registry.get("WALL")``.
+1. Subclass ``ElementBuilder`` with a type key and implement
+   ``build()``::
+
+       class Wall3DBuilder(ElementBuilder, type_key="WALL"):
+           ...
+
+2. At import-time the class is registered; the core API resolves
+   builders via ``plugin_registry.get("WALL")``, which instantiates
+   the builder on first use.
+
+Builders shipped in ``app.plugins.elements`` are found by scanning that
+package.  External packages can contribute builders by declaring an
+entry point in the ``app.plugins.elements`` group that points at the
+module defining them.
 """
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Type
+import functools
+import sys
+import types
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    import importlib.metadata
+
+    import ifcopenshell
+
+__all__ = ["plugin_registry", "PluginRegistry", "ElementBuilder", "discover_plugins"]
 
-import ifcopenshell
 
+class ElementBuilder:
+    """Base class every element plugin must implement.
 
-class ElementBuilder(ABC):
-    """Abstract base class every element plugin must implement."""
+    Passing ``type_key`` in the class statement registers the subclass
+    (the class itself, not an instance) with ``plugin_registry``.
+
+    A plain class rather than an ``ABC`` (or ``typing.Protocol``, whose
+    metaclass derives from ``ABCMeta``): builders are constructed per
+    process, and a missing ``build()`` still fails loudly when called.
+    """
+
+    def __init_subclass__(cls, type_key: Optional[str] = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if type_key is not None:
+            plugin_registry.register(type_key)(cls)
 
-    @abstractmethod
     def build(
         self,
         model: ifcopenshell.file,
@@ -47,29 +73,67 @@ class ElementBuilder(ABC):
         -------
         IfcProduct
             The created IFC element entity.
+
+        Notes
+        -----
+        ``ifcopenshell`` is imported for type checking only, so the
+        ``model`` annotation stays an unresolved string at runtime and
+        importing the registry does not load the IfcOpenShell extension.
+        Nothing in the app calls ``typing.get_type_hints`` on builders.
         """
-        ...
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement build()."
+        )
+
+
+# Type keys come from a tiny closed set, so memoising the upper-casing
+# turns it into one cache probe on the hot path.
+_normalise_key = functools.lru_cache(maxsize=256)(str.upper)
+
+# Upper bound on remembered spellings in the dispatch table, matching
+# the normaliser's cache size.
+_MAX_DISPATCH_KEYS = 256
 
 
 class PluginRegistry:
-    """A simple dictionary-based registry with a decorator API."""
+    """A simple dictionary-based registry with a decorator API.
+
+    Registration stores a zero-argument factory (the builder class);
+    the builder is instantiated on its first ``get()`` and cached, so
+    plugins that are never requested are never constructed.
+
+    Resolved lookups are also remembered under the exact string the
+    caller passed, so repeat calls with the same key (the common case
+    when building many elements) are a single dict probe.
+    """
+
+    __slots__ = ("_builders", "_instances", "_dispatch", "_sorted_keys")
 
     def __init__(self) -> None:
-        self._builders: Dict[str, ElementBuilder] = {}
+        self._builders: Mapping[str, Callable[[], ElementBuilder]] = {}
+        self._instances: Dict[str, ElementBuilder] = {}
+        self._dispatch: Dict[str, ElementBuilder] = {}
+        self._sorted_keys: Tuple[str, ...] = ()
 
     def register(self, type_key: str):
         """Class decorator that registers a builder under *type_key*.
 
-        Example::
-
-            @plugin_registry.register("WALL")
-            class Wall3DBuilder(ElementBuilder):
-                ...
+        ``ElementBuilder`` subclasses declared with ``type_key=...`` go
+        through here automatically; the decorator form remains for
+        builders registered explicitly.
         """
 
         def decorator(cls: Type[ElementBuilder]):
-            instance = cls()
-            self._builders[type_key.upper()] = instance
+            key = sys.intern(_normalise_key(type_key))
+            if self.frozen:
+                raise RuntimeError(
+                    f"Cannot register '{key}': the plugin registry is frozen "
+                    "once discovery has completed."
+                )
+            self._builders[key] = cls
+            self._instances.pop(key, None)
+            self._dispatch.clear()
+            self._sorted_keys = tuple(sorted(self._builders))
             return cls
 
         return decorator
@@ -77,33 +141,133 @@ class PluginRegistry:
     def get(self, type_key: str) -> ElementBuilder:
         """Look up a registered builder by its type key.
 
-        Raises ``KeyError`` with a helpful message on miss.
+        The key is case-insensitive.  Raises ``KeyError`` with a helpful
+        message on miss.
+        """
+        try:
+            return self._dispatch[type_key]
+        except KeyError:
+            pass
+
+        key = _normalise_key(type_key)
+        try:
+            builder = self._instances[key]
+        except KeyError:
+            try:
+                factory = self._builders[key]
+            except KeyError:
+                raise self._unknown_type(key) from None
+            # setdefault keeps a single instance if two threads race here
+            builder = self._instances.setdefault(key, factory())
+
+        if len(self._dispatch) < _MAX_DISPATCH_KEYS:
+            self._dispatch[type_key] = builder
+        return builder
+
+    def get_exact(self, type_key: str) -> ElementBuilder:
+        """Look up a builder by its canonical (upper-case) type key.
+
+        Skips normalisation, so ``"wall"`` is a miss here; meant for hot
+        loops whose keys already come from ``available_types``.  Raises
+        the same ``KeyError`` as ``get()`` on miss.
         """
-        key = type_key.upper()
-        if key not in self._builders:
-            available = ", ".join(sorted(self._builders.keys())) or "(none)"
-            raise KeyError(
-                f"No plugin registered for type '{key}'. "
-                f"Available types: {available}"
-            )
-        return self._builders[key]
+        try:
+            return self._instances[type_key]
+        except KeyError:
+            pass
+        try:
+            factory = self._builders[type_key]
+        except KeyError:
+            raise self._unknown_type(type_key) from None
+        return self._instances.setdefault(type_key, factory())
+
+    def _unknown_type(self, key: str) -> KeyError:
+        available = ", ".join(self._sorted_keys) or "(none)"
+        return KeyError(
+            f"No plugin registered for type '{key}'. "
+            f"Available types: {available}"
+        )
 
     @property
     def available_types(self) -> list[str]:
-        return sorted(self._builders.keys())
+        return list(self._sorted_keys)
+
+    @property
+    def frozen(self) -> bool:
+        return isinstance(self._builders, types.MappingProxyType)
+
+    def freeze(self) -> None:
+        """Make the set of registered builders read-only.
+
+        Called once discovery has completed; later ``register()`` calls
+        raise ``RuntimeError`` instead of silently changing which
+        builder a type resolves to.
+        """
+        if not self.frozen:
+            self._builders = types.MappingProxyType(self._builders)
 
 
 # ── Global singleton ──────────────────────────────────────────────
 plugin_registry = PluginRegistry()
 
 
+ENTRY_POINT_GROUP = "app.plugins.elements"
+
+_ENTRY_POINT_CACHE: Optional[Tuple[importlib.metadata.EntryPoint, ...]] = None
+_DISCOVERED = False
+
+
+def _plugin_entry_points() -> Tuple[importlib.metadata.EntryPoint, ...]:
+    """Return the installed ``app.plugins.elements`` entry points.
+
+    Resolved once per interpreter: reading distribution metadata stats
+    every installed distribution on ``sys.path``.
+    """
+    global _ENTRY_POINT_CACHE
+    if _ENTRY_POINT_CACHE is None:
+        import importlib.metadata
+
+        _ENTRY_POINT_CACHE = tuple(
+            importlib.metadata.entry_points(group=ENTRY_POINT_GROUP)
+        )
+    return _ENTRY_POINT_CACHE
+
+
 def discover_plugins() -> None:
     """Auto-import every module under ``app.plugins.elements``.
 
-    Importing a module triggers its ``@plugin_registry.register``
-    decorators, populating the registry automatically.
+    Importing a module runs its ``ElementBuilder`` subclass statements,
+    which register them, populating the registry automatically.  Modules named
+    by ``app.plugins.elements`` entry points are loaded the same way.
+
+    Idempotent: only the first call per process does any work.
     """
+    global _DISCOVERED
+    if _DISCOVERED:
+        return
+
+    # Imported here so modules that only subclass ElementBuilder never
+    # pull the import machinery helpers into their import graph.
+    import importlib
+    import pkgutil
+
     import app.plugins.elements as elements_pkg
 
-    for _importer, module_name, _ispkg in pkgutil.iter_modules(elements_pkg.__path__):
-        importlib.import_module(f"app.plugins.elements.{module_name}")
+    # Modules are executed eagerly on purpose: registration happens in
+    # the class statement, so an ``importlib.util.LazyLoader`` would
+    # defer it until some attribute access that never comes.  The
+    # expensive part — constructing a builder — is already deferred to
+    # its first ``plugin_registry.get()``.
+    qualify = f"{elements_pkg.__name__}.{{}}".format
+    paths = list(elements_pkg.__path__)
+    for _finder, name, _ispkg in pkgutil.iter_modules(paths):
+        # Private helpers (and anything dunder) are never plugins
+        if name.startswith("_"):
+            continue
+        importlib.import_module(qualify(name))
+
+    for entry_point in _plugin_entry_points():
+        entry_point.load()
+
+    plugin_registry.freeze()
+    _DISCOVERED = True
@@ -5,18 +5,8 @@ Generates a simple IFC file containing a single door based on the provided JSON
 
 from pathlib import Path
 
-import ifcopenshell
-from pydantic import ValidationError
-
-from app.core.ifc_context import create_ifc_context
-from app.models.base import DoorPayload
-from app.plugins.elements.door import DoorBuilder
-
 
 def main():
-    print("Initializing IFC context...")
-    model, storey, body_ctx = create_ifc_context()
-
     door_json = {
         "type": "DOOR",
         "labelName": "Main Entry Door",
@@ -31,24 +21,38 @@ def main():
         "ogid": "door-12345"
     }
 
+    # Heavy imports (pydantic, IfcOpenShell) are deferred until needed
+    from pydantic import ValidationError
+
+    from app.models.base import DoorPayload
+
+    # flush=False: progress lines go out as each step starts, without
+    # forcing a flush per line when stdout is a pipe.
     try:
-        print("Parsing door payload...")
-        payload = DoorPayload(**door_json)
+        print("Parsing door payload...", flush=False)
+        payload = DoorPayload.model_validate(door_json)
     except ValidationError as e:
-        print("Error parsing door payload:")
-        print(e)
+        print("Error parsing door payload:", flush=False)
+        print(e, flush=False)
         return
 
-    print("Building door geometry...")
+    from app.core.ifc_context import create_ifc_context
+
+    print("Initializing IFC context...", flush=False)
+    model, storey, body_ctx = create_ifc_context()
+
+    from app.plugins.elements.door import DoorBuilder
+
+    print("Building door geometry...", flush=False)
     builder = DoorBuilder()
     door = builder.build(model, body_ctx, storey, payload)
 
-    print(f"Created door: {door.Name}")
+    print(f"Created door: {door.Name}", flush=False)
 
-    out_file = Path("door_output.ifc")
-    print(f"Writing IFC file to {out_file.absolute()}...")
-    model.write(str(out_file))
-    print("Done!")
+    out_file = str(Path("door_output.ifc").resolve())
+    print(f"Writing IFC file to {out_file}...", flush=False)
+    model.write(out_file)
+    print("Done!", flush=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+"""Gunicorn configuration for production deployments.
+
+IFC builds are CPU-bound Python and therefore GIL-limited, so throughput
+scales with worker *processes*.  ``UvicornWorker`` selects uvloop and
+httptools automatically when they are installed (``uvicorn[standard]``).
+
+Loaded automatically when ``gunicorn app.main:app`` runs from the
+project root.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Heartbeat files on tmpfs: avoids worker stalls on slow container disks.
+worker_tmp_dir = "/dev/shm"
+
+# Recycle workers periodically to bound heap fragmentation from IFC graphs.
+max_requests = 1000
+max_requests_jitter = 100
@@ -0,0 +1,30 @@
+"""Tests for the request payload schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.base import WallPayload
+
+POINTS = [{"x": 0, "y": 0, "z": 0}, {"x": 4, "y": 0, "z": 0}]
+
+
+def test_wall_points_are_normalised_to_flat():
+    wall = WallPayload(points=POINTS, wallThickness=0.2)
+    assert wall.pointsFlat == [[0.0, 0.0, 0.0], [4.0, 0.0, 0.0]]
+    assert wall.points is None
+
+
+@pytest.mark.parametrize("exclude_none", [False, True])
+def test_wall_round_trips_through_model_dump(exclude_none):
+    wall = WallPayload(points=POINTS, wallThickness=0.2)
+    again = WallPayload.model_validate(wall.model_dump(exclude_none=exclude_none))
+    assert again == wall
+
+
+def test_wall_rejects_points_and_points_flat_together():
+    with pytest.raises(ValidationError, match="not both"):
+        WallPayload(
+            points=POINTS,
+            pointsFlat=[[0, 0, 0], [4, 0, 0]],
+            wallThickness=0.2,
+        )